@@ -1,11 +1,27 @@
 import csv
+import sys
+import threading
 from abc import ABC
+from bisect import bisect_left, insort
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Literal, NamedTuple, Union, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Literal, NamedTuple, Optional, Tuple, Union
 
 PHONEBOOK_FILE_PATH = Path('pb.csv')
 DEFAULT_PAGE_SIZE = 5
+# Количество изменений, после которого справочник сохраняется в файл
+SAVE_THRESHOLD = 10
+# Размер буфера для чтения и перезаписи файла справочника
+CSV_BUFFER_SIZE = 1 << 20
+# Количество удалённых контактов, после которого таблица уплотняется
+COMPACT_THRESHOLD = 64
+# Ширина визитной карточки и её неизменяемые строки
+CARD_WIDTH = 40
+CARD_BORDER = f'+ {"-" * CARD_WIDTH} +'
+CARD_EMPTY_LINE = f'| {" " * CARD_WIDTH} |'
+# Разделитель и заголовок главного меню
+MENU_DIVIDER = '-' * 40
+MENU_TITLE = ' Телефонный справочник '.center(40, '-')
 
 
 def get_answer(
@@ -15,9 +31,8 @@ def get_answer(
 	:param prompt: подсказка которая выводится перед вводом данных
 	:param correct_answers: массив или диапазон валидных ответов
 	"""
-	answer = None
 	print(prompt + ' ', end='')
-	while answer not in correct_answers:
+	while True:
 		answer = input()
 		if answer == '':
 			return None
@@ -31,6 +46,7 @@ def get_answer(
 class SearchCondition(NamedTuple):
 	field: str
 	text: str
+	text_lc: str
 
 
 class Field(NamedTuple):
@@ -48,11 +64,23 @@ field_map = {
 	7: Field('private_phone', 'Личный телефон')
 }
 
-csv_fields = [field.title_ru for field in field_map.values()]
-contact_fields = [field.title_en for field in field_map.values()]
+csv_fields = tuple(field.title_ru for field in field_map.values())
+contact_fields = tuple(
+	sys.intern(field.title_en) for field in field_map.values()
+)
+_VALID_FIELD_IDX = frozenset(field_map.keys())
+# Поля, по которым выполняется поиск по всем полям
+_SEARCHABLE_FIELDS = (
+	'last_name',
+	'name',
+	'middle_name',
+	'organization',
+	'work_phone',
+	'private_phone'
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class Contact:
 	index: int
 	last_name: str = ""
@@ -68,13 +96,184 @@ class Contact:
 	
 	@property
 	def data_row(self) -> List[str]:
-		return list(self.__dict__.values())
+		return [
+			self.index,
+			self.last_name,
+			self.name,
+			self.middle_name,
+			self.organization,
+			self.work_phone,
+			self.private_phone
+		]
+	
+	@property
+	def lowercase_fields(self) -> Dict[str, str]:
+		"""Значения полей контакта (кроме индекса) в нижнем регистре"""
+		return {
+			field: str(getattr(self, field)).lower()
+			for field in _SEARCHABLE_FIELDS
+		}
+
+
+class ContactTable:
+	"""
+	Таблица контактов, хранящая значения полей по столбцам.
+	
+	Индекс контакта совпадает с его позицией среди неудалённых строк таблицы.
+	Удалённые строки помечаются (tombstone) и физически убираются из столбцов
+	только после накопления COMPACT_THRESHOLD удалений, поэтому удаление не
+	сдвигает столбцы. Объекты Contact создаются только для вывода и
+	редактирования.
+	"""
+	
+	def __init__(self, contacts: Iterable[Contact] = ()):
+		# Столбцы со значениями полей (кроме индекса)
+		self.columns: Dict[str, List[str]] = {
+			field: [] for field in contact_fields if field != 'index'
+		}
+		# Те же столбцы в нижнем регистре для поиска по определённым полям
+		self.lc_columns: Dict[str, List[str]] = {
+			field: [] for field in self.columns
+		}
+		# Текстовые поля контактов в нижнем регистре для поиска по всем полям
+		self.lc_blobs: List[str] = []
+		# Отсортированные номера удалённых, но ещё не убранных строк
+		self._tombstones: List[int] = []
+		for contact in contacts:
+			self.append(contact)
+	
+	def __len__(self) -> int:
+		return len(self.lc_blobs) - len(self._tombstones)
+	
+	def append(self, contact: Contact) -> None:
+		"""Добавляет контакт в конец таблицы"""
+		lc_fields = contact.lowercase_fields
+		for field, column in self.columns.items():
+			column.append(getattr(contact, field))
+			self.lc_columns[field].append(lc_fields[field])
+		self.lc_blobs.append(self._search_blob(lc_fields))
+	
+	def update(self, position: int, contact: Contact) -> None:
+		"""Записывает данные контакта на место контакта с номером position"""
+		row = self._row(position)
+		lc_fields = contact.lowercase_fields
+		for field, column in self.columns.items():
+			column[row] = getattr(contact, field)
+			self.lc_columns[field][row] = lc_fields[field]
+		self.lc_blobs[row] = self._search_blob(lc_fields)
+	
+	def delete(self, position: int) -> None:
+		"""Помечает контакт с номером position как удалённый"""
+		insort(self._tombstones, self._row(position))
+		if len(self._tombstones) > COMPACT_THRESHOLD:
+			self.compact()
+	
+	def compact(self) -> None:
+		"""Физически убирает удалённые строки из всех столбцов"""
+		if not self._tombstones:
+			return
+		dead = set(self._tombstones)
+		keep = [row for row in range(len(self.lc_blobs)) if row not in dead]
+		for field, column in self.columns.items():
+			self.columns[field] = [column[row] for row in keep]
+			lc_column = self.lc_columns[field]
+			self.lc_columns[field] = [lc_column[row] for row in keep]
+		self.lc_blobs = [self.lc_blobs[row] for row in keep]
+		self._tombstones.clear()
+	
+	def get(self, position: int) -> Contact:
+		"""Возвращает контакт с номером position"""
+		return self._contact(self._row(position), position)
+	
+	def contacts(self) -> List[Contact]:
+		"""Возвращает все контакты таблицы"""
+		return list(self.iter_contacts())
+	
+	def iter_contacts(self) -> Iterator[Contact]:
+		"""Последовательно возвращает контакты таблицы без создания списка"""
+		dead = set(self._tombstones)
+		rows = (
+			row for row in enumerate(zip(*self.columns.values()))
+			if row[0] not in dead
+		)
+		for idx, (_, values) in enumerate(rows, 1):
+			yield Contact(idx, *values)
+	
+	def lc_column(self, field: str) -> List[str]:
+		"""
+		Возвращает столбец в нижнем регистре для поиска по полю field.
+		Столбец содержит и удалённые строки
+		"""
+		if field == 'index':
+			return [
+				str(self._position(row) + 1)
+				for row in range(len(self.lc_blobs))
+			]
+		return self.lc_columns[field]
+	
+	def search(
+		self, conditions: List[Tuple[Optional[str], str]]
+	) -> List[Contact]:
+		"""
+		Возвращает контакты, удовлетворяющие всем условиям. Условие -
+		пара (поле, текст в нижнем регистре); если поле не указано, текст
+		ищется во всех полях. Каждое следующее условие проверяется только для
+		строк, подошедших под предыдущие
+		"""
+		if not conditions:
+			return []
+		(field, text), *others = conditions
+		column = self.lc_blobs if field is None else self.lc_column(field)
+		rows = [row for row, value in enumerate(column) if text in value]
+		for field, text in others:
+			column = self.lc_blobs if field is None else self.lc_column(field)
+			rows = [row for row in rows if text in column[row]]
+		if not self._tombstones:
+			return [self._contact(row, row) for row in rows]
+		dead = set(self._tombstones)
+		return [
+			self._contact(row, self._position(row))
+			for row in rows if row not in dead
+		]
+	
+	@staticmethod
+	def _search_blob(lc_fields: Dict[str, str]) -> str:
+		"""
+		Склеивает уже приведённые к нижнему регистру поля контакта в строку
+		для поиска по всем полям, чтобы каждое значение понижалось один раз
+		"""
+		return '\n'.join(value for value in lc_fields.values() if value)
+	
+	def _contact(self, row: int, position: int) -> Contact:
+		"""Создаёт контакт с номером position из строки таблицы row"""
+		return Contact(
+			position + 1,
+			*(column[row] for column in self.columns.values())
+		)
+	
+	def _row(self, position: int) -> int:
+		"""Возвращает номер строки в столбцах для контакта с номером position"""
+		# Перед строкой контакта стоит столько удалённых строк, сколько
+		# номеров j удовлетворяют tombstones[j] - j <= position
+		tombstones = self._tombstones
+		lo, hi = 0, len(tombstones)
+		while lo < hi:
+			mid = (lo + hi) // 2
+			if tombstones[mid] - mid <= position:
+				lo = mid + 1
+			else:
+				hi = mid
+		return position + lo
+	
+	def _position(self, row: int) -> int:
+		"""Возвращает номер контакта, хранящегося в строке row"""
+		return row - bisect_left(self._tombstones, row)
 
 
 class Storage(ABC):
 	"""Базовый класс для хранилища"""
 	
-	def save_all(self, contacts: List[Contact]) -> None:
+	def save_all(self, contacts: Iterable[Contact]) -> None:
 		"""Сохраняет все переданные контакты в файл"""
 		pass
 	
@@ -85,13 +284,23 @@ class Storage(ABC):
 	def read_all(self) -> List[Contact]:
 		"""Считывает все контакты из файла"""
 		pass
+	
+	def iter_contacts(self) -> Iterator[Contact]:
+		"""Последовательно считывает контакты из файла"""
+		yield from self.read_all()
 
 
 class CsvFileStorage(Storage):
-	"""Хранилище на основе csv-файла"""
+	"""
+	Хранилище на основе csv-файла
 	
-	def __init__(self, file_path: Path):
+	:param file_path: путь к файлу справочника
+	:param buffer_size: размер буфера при чтении и перезаписи файла
+	"""
+	
+	def __init__(self, file_path: Path, buffer_size: int = CSV_BUFFER_SIZE):
 		self.file_path = file_path
+		self.buffer_size = buffer_size
 		self._init_storage()
 	
 	def _init_storage(self) -> None:
@@ -105,31 +314,33 @@ class CsvFileStorage(Storage):
 				writer.writeheader()
 	
 	def read_all(self) -> List[Contact]:
-		with open(self.file_path) as file:
-			reader = csv.DictReader(file)
-			data = [
-				[row[field] for field in csv_fields] for row in reader
-			]
-			return [Contact(*contact) for contact in data]
+		return list(self.iter_contacts())
+	
+	def iter_contacts(self) -> Iterator[Contact]:
+		with open(
+			self.file_path, newline='', buffering=self.buffer_size
+		) as file:
+			reader = csv.reader(file)
+			next(reader, None)  # заголовок
+			for r in reader:
+				if r:
+					yield Contact(int(r[0]), r[1], r[2], r[3], r[4], r[5], r[6])
 	
 	def add_one(self, contact: Contact) -> None:
-		with open(self.file_path, 'a') as file:
-			file.write(','.join(map(str, contact.data_row)))
+		with open(self.file_path, 'a', newline='') as file:
+			writer = csv.writer(file)
+			writer.writerow(contact.data_row)
+			file.flush()
 			print('Файл сохранён')
 	
-	def save_all(self, contacts: List[Contact]) -> None:
-		with open(self.file_path, 'w') as file:
-			writer = csv.DictWriter(file, fieldnames=csv_fields)
-			rows = [self._to_csv(contact) for contact in contacts]
-			writer.writeheader()
-			writer.writerows(rows)
+	def save_all(self, contacts: Iterable[Contact]) -> None:
+		with open(
+			self.file_path, 'w', newline='', buffering=self.buffer_size
+		) as file:
+			writer = csv.writer(file)
+			writer.writerow(csv_fields)
+			writer.writerows(contact.data_row for contact in contacts)
 			print('Файл сохранён')
-	
-	@staticmethod
-	def _to_csv(contact) -> dict:
-		"""Конвертирует поля из датакласса в заголовки для файла csv"""
-		csv_field_map = {x[0]: x[1] for x in field_map.values()}
-		return {csv_field_map[k]: v for k, v in contact.__dict__.items()}
 
 
 class ContactFormatter(ABC):
@@ -158,47 +369,28 @@ class ConsoleVisitCardFormatter(ContactFormatter):
 	
 	def print_contacts(self, contacts, paginate=True, page_size=1) -> None:
 		contact_count = len(contacts)
-		for contact in contacts:
+		for i, contact in enumerate(contacts, 1):
 			self._print_card(contact, contact_count)
-			if paginate and int(contact.index) < contact_count:
+			if paginate and i < contact_count:
 				answer = input(
 					'Нажмите Enter для продолжения или q для выхода в меню:')
 				if answer == 'q':
 					return None
 	
 	@staticmethod
-	def _print_card(
-		contact: Contact, contact_count: int, card_width=40) -> None:
-		print('+', ''.center(card_width, '-'), '+')
-		counter = ' '.join([str(contact.index), "/", str(contact_count)])
-		print(f'| № {counter.ljust(card_width - 2)} |')
-		print('|', contact.full_name.center(card_width), '|')
-		print('|', ''.center(card_width), '|')
+	def _print_card(contact: Contact, contact_count: int) -> None:
+		print(CARD_BORDER)
+		counter = f'{contact.index} / {contact_count}'
+		print(f'| № {counter:<{CARD_WIDTH - 2}} |')
+		print(f'| {contact.full_name:^{CARD_WIDTH}} |')
+		print(CARD_EMPTY_LINE)
 		if contact.organization:
-			print(
-				'|',
-				(
-					'Организация: ' + contact.organization
-				).center(card_width),
-				'|'
-			)
+			print(f'| {f"Организация: {contact.organization}":^{CARD_WIDTH}} |')
 		if contact.work_phone:
-			print(
-				'|',
-				(
-					'Рабочий телефон: ' + str(contact.work_phone)
-				).center(card_width),
-				'|'
-			)
+			print(f'| {f"Рабочий телефон: {contact.work_phone}":^{CARD_WIDTH}} |')
 		if contact.private_phone:
-			print(
-				'|',
-				(
-					'Личный телефон: ' + str(contact.private_phone)
-				).center(card_width),
-				'|'
-			)
-		print('+', ''.center(card_width, '-'), '+')
+			print(f'| {f"Личный телефон: {contact.private_phone}":^{CARD_WIDTH}} |')
+		print(CARD_BORDER)
 
 
 class ConsoleTableFormatter(ContactFormatter):
@@ -222,34 +414,26 @@ class ConsoleTableFormatter(ContactFormatter):
 		if len(contacts) > page_size:
 			page_size = self._get_page_size()
 		
-		# Массивы с максимальными длинами полей по всем строкам с данными
-		row_size_arrays = [
-			[len(str(field)) for field in contact.data_row]
-			for contact in contacts
-		]
-		# Максимальные длины строк по столбцам заголовка
-		header_size_array = [len(field) for field in csv_fields]
-		row_size_arrays.append(header_size_array)
+		contact_list = [contact.data_row for contact in contacts]
 		
-		# Максимальные длины строк по столбцам данных
-		max_column_len = list(
-			map(lambda x: max(x), list(zip(*row_size_arrays)))
-		)
+		# Максимальные длины строк по столбцам заголовка и данных
+		max_column_len = [
+			max(
+				len(title),
+				max((len(str(row[i])) for row in contact_list), default=0)
+			)
+			for i, title in enumerate(csv_fields)
+		]
 		
 		# Вывод заголовка таблицы
 		self._print_table_divider(max_column_len)
 		self._print_table_data_row(csv_fields, max_column_len)
 		self._print_table_divider(max_column_len)
 		
-		contact_list = [contact.data_row for contact in contacts]
-		
-		for row in contact_list:
+		contact_count = len(contact_list)
+		for i, row in enumerate(contact_list, 1):
 			self._print_table_data_row(row, max_column_len)
-			if (
-				paginate and
-				int(row[0]) % page_size == 0 and
-				int(row[0]) != len(contacts)
-			):
+			if paginate and i % page_size == 0 and i != contact_count:
 				answer = get_answer(
 					'Нажмите Enter чтобы продолжить или "q" для выхода',
 					['', 'q']
@@ -287,39 +471,99 @@ class Phonebook:
 	def __init__(self, formatter: ContactFormatter, storage: Storage):
 		self._storage = storage
 		self._formatter = formatter
-		self._contacts: List[Contact] = self._storage.read_all()
-		self._last_index: int = len(self._contacts)
+		# Контакты считываются в фоне, чтобы меню выводилось сразу
+		self._table = ContactTable()
+		self._loaded = threading.Event()
+		self._load_error: Optional[Exception] = None
+		threading.Thread(target=self._load_contacts, daemon=True).start()
+		self._dirty: bool = False
+		self._pending_ops: int = 0
+		# Обработчики команд главного меню (латиница и кириллица)
+		self._commands: Dict[str, Callable[[], None]] = {
+			'p': self._print_all_contacts, 'з': self._print_all_contacts,
+			'a': self._add_contact, 'ф': self._add_contact,
+			's': self._print_find_menu, 'ы': self._print_find_menu,
+			'c': self._change_contact, 'с': self._change_contact,
+			'd': self._delete_contact, 'в': self._delete_contact,
+			'f': self._change_formatter, 'а': self._change_formatter,
+			'q': self._quit, 'й': self._quit,
+		}
 	
 	def start(self):
 		"""Основной цикл программы"""
 		answer = ''
-		while answer not in ['q', 'й']:
-			self._print_main_menu()
-			answer = input('Введите команду: ').lower()
-			if answer in ['p', 'з']:
-				self._formatter.print_contacts(self._contacts)
-			elif answer in ['a', 'ф']:
-				self._add_contact()
-			elif answer in ['s', 'ы']:
-				self._print_find_menu()
-			elif answer in ['c', 'с']:
-				self._change_contact()
-			elif answer in ['d', 'в']:
-				self._delete_contact()
-			elif answer in ['f', 'а']:
-				self._change_formatter()
-			elif answer in ['q', 'й']:
-				exit()
-			else:
-				print('Неверная команда')
-				continue
-			input('Нажмите Enter чтобы вывести меню\n')
+		try:
+			while answer not in ['q', 'й']:
+				self._print_main_menu()
+				answer = input('Введите команду: ').lower()
+				handler = self._commands.get(answer)
+				if not handler:
+					print('Неверная команда')
+					continue
+				self._wait_loaded()
+				if self._load_error is not None and handler != self._quit:
+					print(
+						'Справочник не загружен, доступен только выход: '
+						f'{self._load_error}'
+					)
+					continue
+				handler()
+				input('Нажмите Enter чтобы вывести меню\n')
+		finally:
+			# Несохранённые изменения записываются и при EOF, Ctrl-C или ошибке
+			self.close()
+	
+	def _load_contacts(self) -> None:
+		"""Заполняет таблицу контактами из хранилища (в фоновом потоке)"""
+		try:
+			for contact in self._storage.iter_contacts():
+				self._table.append(contact)
+		except Exception as error:
+			self._load_error = error
+		finally:
+			self._loaded.set()
+	
+	def _wait_loaded(self) -> None:
+		"""Ожидает окончания загрузки контактов"""
+		if not self._loaded.is_set():
+			print('Загрузка контактов...')
+			self._loaded.wait()
+	
+	def _print_all_contacts(self) -> None:
+		"""Выводит все контакты справочника"""
+		self._formatter.print_contacts(self._table.contacts())
+	
+	def _quit(self) -> None:
+		"""Сохраняет изменения и завершает работу программы"""
+		self.close()
+		exit()
+	
+	def close(self) -> None:
+		"""Сохраняет несохранённые изменения перед завершением работы"""
+		self._wait_loaded()
+		if self._load_error is not None:
+			# Справочник загружен не полностью - сохранение затёрло бы файл
+			return
+		if self._dirty:
+			self._storage.save_all(self._table.iter_contacts())
+			self._dirty = False
+			self._pending_ops = 0
+	
+	def _mark_dirty(self) -> None:
+		"""
+		Отмечает справочник как изменённый. Файл перезаписывается только после
+		накопления SAVE_THRESHOLD изменений или при выходе из программы
+		"""
+		self._dirty = True
+		self._pending_ops += 1
+		if self._pending_ops >= SAVE_THRESHOLD:
+			self.close()
 	
 	def _print_main_menu(self) -> None:
 		"""Выводит главное меню"""
-		print('-' * 40)
-		print(' Телефонный справочник '.center(40, '-'))
-		print('-' * 40)
+		print(MENU_DIVIDER)
+		print(MENU_TITLE)
+		print(MENU_DIVIDER)
 		print(' p - Вывод всех контактов')
 		print(' a - Добавить контакт в справочник')
 		print(' s - Поиск контакта')
@@ -327,21 +571,28 @@ class Phonebook:
 		print(' d - Удалить контакт')
 		print(' f - Изменить формат вывода')
 		print(' q - Выход')
-		print(''.center(40, '-'))
-		print(f' Количество контактов в базе: {self._last_index}')
+		print(MENU_DIVIDER)
+		if self._load_error is not None:
+			print(f' Ошибка загрузки справочника: {self._load_error}')
+		else:
+			loading = '' if self._loaded.is_set() else ' (идёт загрузка)'
+			print(f' Количество контактов в базе: {len(self._table)}{loading}')
 		print(f' Формат вывода: {self._formatter.name}')
 		print(f' Количество элементов на странице: {DEFAULT_PAGE_SIZE}')
-		print(''.center(40, '-'))
+		print(MENU_DIVIDER)
 	
 	def _add_contact(self) -> None:
 		"""Добавляет контакт в справочник"""
-		contact = Contact(index=self._last_index + 1)
+		contact = Contact(index=len(self._table) + 1)
 		self._input_contact_data(contact, mode='add')
-		print(''.center(40, '-'))
+		print(MENU_DIVIDER)
 		print(f'Контакт "{contact.full_name}" успешно добавлен!')
-		print(''.center(40, '-'))
-		self._last_index += 1
-		self._storage.add_one(contact)
+		print(MENU_DIVIDER)
+		if self._dirty:
+			# В файле ещё нет несохранённых изменений - дописывать строку нельзя
+			self._mark_dirty()
+		else:
+			self._storage.add_one(contact)
 	
 	def _print_find_menu(self) -> None:
 		"""Выполняет поиск"""
@@ -352,7 +603,7 @@ class Phonebook:
 		if not answer:
 			print()
 			return
-		if answer == '1':
+		if answer == 1:
 			self._find_contacts_by_all_fields()
 			return
 		else:
@@ -381,11 +632,7 @@ class Phonebook:
 	def _find_contacts_by_all_fields(self) -> None:
 		"""Ищет контакты с совпадением в любых полях"""
 		search = str(input('\nВведите строку для поиска: ')).lower()
-		found_contacts = []
-		for contact in self._contacts:
-			for value in contact.__dict__.values():
-				if search in value.lower() and contact not in found_contacts:
-					found_contacts.append(contact)
+		found_contacts = self._table.search([(None, search)])
 		self._print_search_results(found_contacts)
 	
 	def _print_search_results(self, contacts: List[Contact]) -> None:
@@ -407,7 +654,7 @@ class Phonebook:
 		print('-' * len(message))
 		print(message)
 		print('-' * len(message))
-		self._storage.save_all(self._contacts)
+		self._mark_dirty()
 	
 	def _delete_contact(self) -> None:
 		"""Удаляет контакт из справочника"""
@@ -424,10 +671,10 @@ class Phonebook:
 			if answer in ['n', 'н', 'нет', 'no']:
 				return
 			elif answer in ['y', 'д', 'да', 'yes']:
-				self._contacts.remove(contact)
+				self._table.delete(contact.index - 1)
 				print('Контакт удалён')
-				self._update_indexes()
-				self._storage.save_all(self._contacts)
+				self._mark_dirty()
+				return
 			else:
 				print(
 					'Неверный ввод. Введите "д"/"y" для подтвержения '
@@ -447,7 +694,6 @@ class Phonebook:
 		"""Добавленяет новый контакт или изменяет существующий"""
 		if mode == 'add':
 			print("Введите данные контакта:")
-			self._contacts.append(contact)
 		elif mode == 'edit':
 			print(
 				'Введите новые данные контакта\n'
@@ -463,41 +709,31 @@ class Phonebook:
 				if data == '---':
 					data = ''
 				setattr(contact, field.title_en, data)
+		if mode == 'add':
+			self._table.append(contact)
+		else:
+			self._table.update(contact.index - 1, contact)
 	
 	def _get_contact_by_index(self) -> Contact or None:
 		"""Возвращает контакт по индексу"""
 		index = get_answer(
-			'Введите индекс контакта:', range(1, self._last_index + 1))
+			'Введите индекс контакта:', range(1, len(self._table) + 1))
 		if not index:
 			return None
-		return self._contacts[int(index) - 1]
-	
-	def _update_indexes(self) -> None:
-		"""Обновляет индексы всех контактов при удалении"""
-		for idx, contact in enumerate(self._contacts, 1):
-			contact.index = idx
-		self._last_index = len(self._contacts)
+		return self._table.get(int(index) - 1)
 	
 	def _get_field_indexes(self) -> List[int]:
 		"""Валидирует ввод индексов полей контатка"""
-		search_field_indexes = []
-		answer = ['_']
-		while len(search_field_indexes) != len(answer):
-			answer = input()
-			answer = answer.split()
-			search_field_indexes = list(
-				map(
-					lambda x: int(x.strip()),
-					filter(
-						lambda x: x.strip().isnumeric()
-						          and int(x) in range(max(field_map.keys())),
-						answer
-					)
-				)
-			)
-			if len(search_field_indexes) != len(answer):
-				print('Введено неверное значение, попробуйте ещё раз: ', end='')
-		return search_field_indexes
+		while True:
+			search_field_indexes = []
+			for token in input().split():
+				if not token.isdecimal() or \
+					(n := int(token)) not in _VALID_FIELD_IDX:
+					break
+				search_field_indexes.append(n)
+			else:
+				return search_field_indexes
+			print('Введено неверное значение, попробуйте ещё раз: ', end='')
 	
 	@staticmethod
 	def _get_search_conditions(
@@ -507,10 +743,10 @@ class Phonebook:
 		print('Введите текст для поиска')
 		for field in search_field_indexes:
 			search_field_title = field_map[field].title_ru
-			search_field = field_map[field].title_en
+			search_field = sys.intern(field_map[field].title_en)
 			search_text = input(f"Поле '{search_field_title}': ")
 			search_conditions.append(
-				SearchCondition(search_field, search_text)
+				SearchCondition(search_field, search_text, search_text.lower())
 			)
 		return search_conditions
 	
@@ -518,16 +754,9 @@ class Phonebook:
 		self, search_conditions: List[SearchCondition]
 	) -> List[Optional[Contact]]:
 		"""Возвращает контакты соответствующие всем критериям поиска"""
-		found_contacts = []
-		for contact in self._contacts:
-			matched_fields_count = 0
-			for search in search_conditions:
-				if search.text.lower() in getattr(contact, search.field).lower():
-					matched_fields_count += 1
-				if matched_fields_count == len(search_conditions) \
-					and contact not in found_contacts:
-					found_contacts.append(contact)
-		return found_contacts
+		return self._table.search(
+			[(search.field, search.text_lc) for search in search_conditions]
+		)
 
 
 def main():